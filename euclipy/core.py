@@ -9,8 +9,10 @@ Typical usage example:
 """
 
 import collections
+import functools
 import itertools
 import pprint
+import weakref
 
 import networkx
 import sympy
@@ -39,6 +41,23 @@ class RegisteredObject:
     """
     
     type_one_constructions_done = False
+    # Incremented whenever a measure value or the points of a line change,
+    # invalidating values cached with revision_cached_property
+    revision = 0
+    _key = None
+    _registry = {}
+    _auto_key_iter = itertools.count(1).__next__
+    # Maps each class to weak references to its subclasses at any depth, in
+    # preorder. Weak references keep the cache from pinning classes.
+    _descendants = weakref.WeakKeyDictionary()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each class has its own registry and numbers its auto-generated keys
+        # independently
+        cls._registry = {}
+        cls._auto_key_iter = itertools.count(1).__next__
+        RegisteredObject._descendants = weakref.WeakKeyDictionary()
     
     # Instance methods for initializing/registering and deregistering objects
     def __new__(cls, key=None) -> None:
@@ -47,7 +66,7 @@ class RegisteredObject:
         obj._successor = None
         obj._callbacks = []
         obj.key = key if key else obj.auto_key()
-        obj.get_registry()[obj.key] = obj
+        cls._registry[obj.key] = obj
         return obj
 
     def __getattribute__(self, name):
@@ -70,7 +89,7 @@ class RegisteredObject:
     def key(self, value):
         """Set key for object in registry
         """
-        check_registry = hasattr(self, '_key')
+        check_registry = self._key is not None
         self._key = value
         if check_registry: # pragma: no cover TODO: Remove this line once implemented
             for obj in self.elements():
@@ -93,10 +112,19 @@ class RegisteredObject:
                 self.broadcast_change(None)
 
     def broadcast_change(self, successor):
-        for callback in self._callbacks:
+        # Callbacks registered while broadcasting are fired as well, so
+        # iterate over the live list rather than a copy
+        dead_refs = False
+        for ref in self._callbacks:
+            callback = ref()
+            if callback is None:
+                dead_refs = True
+                continue
             callback(self, successor)
             if successor:
                 successor.call_when_changed(callback)
+        if dead_refs:
+            self._callbacks[:] = [ref for ref in self._callbacks if ref() is not None]
 
     def replace(self, successor):
         assert type(self) is type(successor)
@@ -110,7 +138,22 @@ class RegisteredObject:
         # TODO: Should also clean up registry
 
     def call_when_changed(self, callback):
-        self._callbacks.append(callback)
+        """Register callback(self, successor) to be called when self changes
+
+        Callbacks are held by weak reference, so registering a bound method
+        does not keep its object alive once it is no longer in use.
+        """
+        try:
+            ref = weakref.WeakMethod(callback)
+        except TypeError:
+            ref = weakref.ref(callback)
+        self._callbacks.append(ref)
+
+    @staticmethod
+    def bump_revision():
+        """Invalidate all values cached with revision_cached_property
+        """
+        RegisteredObject.revision += 1
 
     @staticmethod
     def do_type_one_constructions():
@@ -139,19 +182,20 @@ class RegisteredObject:
             instances of the same class (not unique among subclasses)
         """
         # TODO: There may not be users of auto_key left.  Consider removing
-        if '_auto_key_counter' not in cls.__dict__:
-            cls._auto_key_counter = 0
-        cls._auto_key_counter += 1
-        return cls._auto_key_counter
+        return cls._auto_key_iter()
 
     @classmethod
     def get_registry(cls):
         """Obtain class-specific registry for cls
         """
-        if '_registry' not in cls.__dict__:
-            cls._registry = {}
         return cls._registry
 
+    @classmethod
+    def keys_view(cls):
+        """Live view of the keys registered for cls
+        """
+        return cls._registry.keys()
+
     @classmethod
     def get(cls, key):
         """Obtain element from cls sub-registry by key
@@ -164,21 +208,38 @@ class RegisteredObject:
         """
         return cls.get_registry().values()
 
+    @classmethod
+    def descendants(cls):
+        """Tuple of all subclasses of cls at any depth, in preorder
+
+        The result is cached until a subclass is defined or one of the cached
+        subclasses has been garbage collected.
+        """
+        refs = RegisteredObject._descendants.get(cls)
+        if refs is not None:
+            descendants = tuple(ref() for ref in refs)
+            if None not in descendants:
+                return descendants
+        descendants = []
+        for sub in cls.__subclasses__():
+            descendants.append(sub)
+            descendants.extend(sub.descendants())
+        descendants = tuple(descendants)
+        RegisteredObject._descendants[cls] = tuple(weakref.ref(sub) for sub in descendants)
+        return descendants
+
     @classmethod
     def elements_recursive(cls):
         """Iterator for all registered elements of cls and its subclasses
         """
-        own = cls.elements()
-        subs = (_.elements_recursive() for _ in cls.__subclasses__())
-        return itertools.chain(own, itertools.chain.from_iterable(subs))
+        subs = (_.elements() for _ in cls.descendants())
+        return itertools.chain(cls.elements(), itertools.chain.from_iterable(subs))
 
     @classmethod
     def classes_recursive(cls):
         """Iterator for all registered elements of cls and its subclasses
         """
-        own = cls.__subclasses__()
-        subs = (_.classes_recursive() for _ in own)
-        return set(itertools.chain(own, itertools.chain.from_iterable(subs)))
+        return set(cls.descendants())
 
     @classmethod
     def remove_duplicates(cls):
@@ -203,8 +264,7 @@ class RegisteredObject:
         """
         for _cls in cls.__subclasses__():
             _cls.reset_registry()
-        if '_registry' in cls.__dict__:
-            del cls._registry
+        cls._registry = {}
 
     @classmethod
     def recursive_registry(cls):
@@ -261,22 +321,32 @@ class RegisteredObject:
 class Expression(RegisteredObject):
     """Algebraic expressions and functionality to solve system of equations
 
-    TODO: It is possible to insert two equivalent expressions into the registry.
-    This can be avoided by prempting instantiation and testing for each
-    registered non-zero expression e whether sympy.simplify(e.expr - expr) == 0
+    Expressions are deduplicated at instantiation by their simplified form
+    (see expr_index), so constructing an identical expression returns the
+    registered instance.
+
+    TODO: It is still possible to insert two equivalent expressions whose
+    simplified forms differ into the registry. This can be avoided by testing
+    for each registered non-zero expression e whether
+    sympy.simplify(e.expr - expr) == 0
     """
+
+    _initialized = False
+
     def __new__(cls, expr, predecessor=None, substitutions=None):
         assert isinstance(expr, sympy.Expr)
         # If an expression matching the new expr is already in the registry,
         # and the new expr has no predecessor,
         # then simply return the registered expression.
-        expr = sympy.simplify(expr)
-        for e in cls.elements():
-            if predecessor is None and sympy.simplify(e.expr) == expr:
-                return e
+        expr = _simplify(expr)
+        if predecessor is None:
+            registered = cls.expr_index().get(expr)
+            if registered is not None:
+                return registered
         # Otherwise, create a new expression and return it.
         obj = super().__new__(cls)
         obj.expr = expr
+        cls.expr_index()[expr] = obj
         if substitutions:
             assert isinstance(substitutions, dict)
         obj.substitutions = substitutions
@@ -287,7 +357,11 @@ class Expression(RegisteredObject):
         return obj
 
     def __init__(self, expr, predecessor=None, substitutions=None) -> None:
+        # __new__ may return an already registered (and solved) Expression
+        if self._initialized:
+            return
         super().__init__()
+        self._initialized = True
         Expression.solve_system()
 
     def __getattribute__(self, name):
@@ -297,6 +371,14 @@ class Expression(RegisteredObject):
     def _identifier(self):
         return self.expr
 
+    def replace(self, successor):
+        # Only drop the index entry if it still points at self; an equal
+        # expression registered later may have taken over the slot.
+        index = self.expr_index()
+        if index.get(self.expr) is self:
+            del index[self.expr]
+        super().replace(successor)
+
     def subs(self, replacements) -> None:
         """Make substitutions from replacements in expression (self.expr)
 
@@ -337,6 +419,23 @@ class Expression(RegisteredObject):
             sub = ''
         return f'{self.__class__.__name__}({self.expr}{rep}{sub})'
 
+    @classmethod
+    def expr_index(cls):
+        """Obtain dict mapping simplified sympy expressions to the registered
+        Expression holding them, used to deduplicate at instantiation
+        """
+        if '_by_expr' not in cls.__dict__:
+            cls._by_expr = {}
+        return cls._by_expr
+
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry and expression index to empty dicts
+        """
+        super().reset_registry()
+        if '_by_expr' in cls.__dict__:
+            del cls._by_expr
+
     @classmethod
     def subs_all_expressions(cls, replacements:dict):
         """Make substitutions in replacements in all registered Expressions
@@ -348,6 +447,43 @@ class Expression(RegisteredObject):
         for expr in list(cls.elements()):
             expr.subs(replacements)
 
+    @staticmethod
+    def solve_linear_system(exprs):
+        """Solve exprs directly if they form a linear system with a unique
+        solution: by LU decomposition if the system is square, otherwise by
+        Gauss-Jordan elimination.
+
+        Args:
+            exprs: list of sympy expressions, each implicitly equal to zero
+
+        Returns:
+            - list with a single dict mapping symbols to their solutions, in
+              the format of sympy.solve(..., dict=True)
+            - empty list if the system is linear and inconsistent
+            - None if the system is nonlinear or does not have a unique
+              solution, in which case the general solver must be used
+        """
+        symbols = sorted(set().union(*(e.free_symbols for e in exprs)), key=str)
+        if not symbols or len(symbols) > len(exprs):
+            return None
+        try:
+            A, b = sympy.linear_eq_to_matrix(exprs, symbols)
+        except ValueError: # Raised as NonlinearError for nonlinear systems
+            return None
+        if len(symbols) == len(exprs):
+            if A.det() == 0:
+                return None
+            values = A.LUsolve(b)
+        else:
+            try:
+                values, params = A.gauss_jordan_solve(b)
+            except ValueError: # Raised for inconsistent systems
+                return []
+            if params:
+                return None
+        return [{sym: val if val.is_Rational else sympy.simplify(val)
+                 for sym, val in zip(symbols, values)}]
+
     @classmethod
     def solve_system(cls):
         """Solve expressions for positive values.
@@ -366,10 +502,12 @@ class Expression(RegisteredObject):
         unsolved = [e for e in cls.elements() if e.expr != 0]
         if not unsolved:
             return {}
-        try:
-            solutions = sympy.solve([e.expr for e in unsolved], dict=True)
-        except NotImplementedError:
-            return {}
+        solutions = cls.solve_linear_system([e.expr for e in unsolved])
+        if solutions is None:
+            try:
+                solutions = sympy.solve([e.expr for e in unsolved], dict=True)
+            except NotImplementedError:
+                return {}
         if not solutions:
             raise exceptions.SystemOfEquationsError('Unsolved expressions with no solution.')
         uniques = set.intersection(*[set(sol.items()) for sol in solutions])
@@ -429,6 +567,26 @@ class GeometricObject(RegisteredObject):
         obj = super().__new__(cls, key=key)
         return obj
 
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry and forget the measures of objects of cls
+        """
+        if cls is GeometricObject:
+            # Full reset of measured objects: clear the symbol maps once, so
+            # the resets of subclasses below have nothing left to filter
+            Measure.reset_symbol_maps()
+        super().reset_registry()
+        if cls is not GeometricObject and cls.has_measurable_instances():
+            Measure.forget_measures_of(cls)
+
+    @classmethod
+    def has_measurable_instances(cls):
+        """True if cls or any of its ancestors or subclasses defines a
+        MeasurableProperty
+        """
+        return any(_cls.class_measures() for _cls in cls.__mro__ + cls.descendants()
+                   if issubclass(_cls, GeometricObject))
+
     @classmethod
     def class_measures(cls):
         if '_class_measures' not in vars(cls):
@@ -558,8 +716,15 @@ class GeometricObject(RegisteredObject):
 
 class Measure:
 
-    _sym_to_measure = collections.defaultdict(list)
-    _del_sym_to_measure = collections.defaultdict(list)
+    # Measures are created for every measured object, so they do without an
+    # instance __dict__
+    __slots__ = ('measured_object', 'name', 'history', 'value')
+
+    # Reverse map from symbol to the Measures currently valued by it. Values
+    # are dicts used as insertion-ordered sets, so a Measure set to the same
+    # symbol twice is only listed once.
+    _sym_to_measure = collections.defaultdict(dict)
+    _del_sym_to_measure = collections.defaultdict(dict)
 
     def __init__(self, measured_object, measure_name, valid_value):
         """valid_value: sympy number or symbol
@@ -575,14 +740,39 @@ class Measure:
                f'measured_object={self.measured_object})')
 
     def _set_value(self, valid_value):
+        RegisteredObject.bump_revision()
         self.value = valid_value
         self.history.append(valid_value)
         if valid_value.is_symbol:
-            Measure._sym_to_measure[valid_value].append(self)
+            Measure._sym_to_measure[valid_value][self] = None
+
+    @staticmethod
+    def reset_symbol_maps():
+        """Forget the Measures of all symbols
+        """
+        Measure._sym_to_measure = collections.defaultdict(dict)
+        Measure._del_sym_to_measure = collections.defaultdict(dict)
+
+    @staticmethod
+    def forget_measures_of(cls):
+        """Drop the Measures of instances of cls from the symbol maps, so
+        Measures of objects dropped from the registry are neither kept alive
+        nor found by symbol
+        """
+        for sym_map in (Measure._sym_to_measure, Measure._del_sym_to_measure):
+            for sym, measures in list(sym_map.items()):
+                kept = {m: None for m in measures
+                        if not isinstance(m.measured_object, cls)}
+                if kept:
+                    sym_map[sym] = kept
+                else:
+                    del sym_map[sym]
 
     @staticmethod
     def measures_with_symbol(sym):
-        return Measure._sym_to_measure.get(sym, [])
+        if not sym.is_symbol:
+            return []
+        return list(Measure._sym_to_measure.get(sym, ()))
 
     @staticmethod
     def objects_measured_by(sym):
@@ -649,7 +839,13 @@ class MeasurableProperty:
     @staticmethod
     def validate(value):
         try:
-            return sympy.sympify(value).simplify()
+            # sympy values need no conversion, and numbers and symbols no
+            # simplification
+            if not isinstance(value, sympy.Basic):
+                value = sympy.sympify(value)
+            if value.is_Atom:
+                return value
+            return _simplify(value)
         except (sympy.SympifyError, AttributeError):
             raise ValueError(f'{value} is not a valid number, symbol or '\
                              f'expression for a measure')
@@ -672,5 +868,35 @@ class MeasurableProperty:
         symbol = f'{prefix}{self._auto_symbol_counter[prefix]}'
         return self.create_measure(instance, symbol)
 
+
+def revision_cached_property(method):
+    """Decorator for a property derived from measures and line points
+
+    The value is cached on the instance and recomputed only after
+    RegisteredObject.revision changes. A copy of the cached list is returned,
+    so callers may modify it.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def getter(self):
+        cache = self.__dict__.setdefault('_revision_cache', {})
+        revision, value = cache.get(name, (None, None))
+        if revision != RegisteredObject.revision:
+            # Record the revision from before computing, so changes made
+            # while computing invalidate the value
+            revision = RegisteredObject.revision
+            value = method(self)
+            cache[name] = (revision, value)
+        return list(value)
+    return property(getter)
+
+@functools.lru_cache(maxsize=4096)
+def _simplify(expr):
+    """Memoized sympy.simplify, as the same expressions are typically
+    simplified repeatedly while expressions are deduplicated and substituted
+    """
+    return sympy.simplify(expr)
+
 if __name__ == '__main__':
     pass
\ No newline at end of file
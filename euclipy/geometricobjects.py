@@ -7,7 +7,9 @@ Typical usage example:
     TODO: Provide usage example
 """
 
+import collections
 import functools
+import itertools
 import sympy
 from euclipy.core import GeometricObject, Expression, Measure, MeasurableProperty
 import euclipy.exceptions as exceptions
@@ -32,14 +34,26 @@ class Point(GeometricObject):
     def __new__(cls, label: str):
         if not isinstance(label, str):
             raise ValueError('Points require string labels.')
-        registered_point = cls.get(label)
+        registered_point = cls._registry.get(label)
         if registered_point:
             return registered_point
         if label == '':
             raise ValueError('Empty string is not a valid Point label.')
         if ' ' in label:
             raise ValueError('Spaces are not permitted in Point labels.')
-        return super().__new__(cls, key=label)
+        obj = super().__new__(cls, key=label)
+        obj._hash = hash(label)
+        # Plain string used to order Points without dispatching to __lt__
+        obj._sort_key = label
+        return obj
+
+    @classmethod
+    def bulk_get(cls, labels):
+        """Tuple of Points for labels, constructing only the Points that are not
+        registered yet
+        """
+        registry = cls._registry
+        return tuple(registry.get(label) or cls(label) for label in labels)
 
     @property
     def _identifier(self):
@@ -49,16 +63,26 @@ class Point(GeometricObject):
         return self.key < obj.key
 
     def __eq__(self, obj):
-        return self.key == obj.key
+        # Points are interned by label, so equal Points are the same object
+        return self is obj
 
     def __hash__(self):
-        return hash(self.key)
+        return self._hash
 
     def __repr__(self) -> str: # pragma: no cover
         """Provides string represetnation of point, e.g. 'Point(A)'
         """
         return f'{self.__class__.__name__}({self.key})'
 
+@functools.lru_cache(maxsize=4096)
+def _parse_label(label_string):
+    """Split a space-delimited string of point labels into a tuple of labels
+
+    Only the strings are cached; Points are looked up on every call, so the
+    cache stays valid across registry resets.
+    """
+    return tuple(label_string.split(' '))
+
 def points(pts):
     """Provides standard representation of point(s) from multiple inputs
 
@@ -82,10 +106,22 @@ def points(pts):
     >>> points('A B')
     (Point(A), Point(B))
     """
+    # Fast path for the most common input: a pair or triple of distinct Points
+    if type(pts) is tuple:
+        num_pts = len(pts)
+        if num_pts == 2:
+            pt_a, pt_b = pts
+            if type(pt_a) is Point and type(pt_b) is Point and pt_a is not pt_b:
+                return pts
+        elif num_pts == 3:
+            pt_a, pt_b, pt_c = pts
+            if (type(pt_a) is Point and type(pt_b) is Point and type(pt_c) is Point
+                    and pt_a is not pt_b and pt_b is not pt_c and pt_a is not pt_c):
+                return pts
     if isinstance(pts, Point):
         return pts
     if isinstance(pts, str):
-        pts = tuple(Point(pt_label) for pt_label in pts.split(' '))
+        pts = Point.bulk_get(_parse_label(pts))
     if not (isinstance(pts, tuple) and all(isinstance(p, Point) for p in pts)):
         raise ValueError('Invalid representation of point(s) as input')
     if len(pts) != len(set(pts)):
@@ -101,20 +137,28 @@ class Line(GeometricObject):
     Attributes:
         points: tuple of Points, as ordered on the line they are a part of
     """
+
+    # Maps each Point to the set of registered Lines through it
+    _point_index = collections.defaultdict(set)
+
     def __new__(cls, pts):
         pts = points(pts)
         if not (isinstance(pts, tuple) and len(pts) > 1):
             raise ValueError('Instantiating a Line requires >= 2 points.')
         canonical_points = cls.canonical_points(pts)
         key = ' '.join([p.key for p in canonical_points])
-        registered = cls.get(key)
+        registered = cls._registry.get(key)
         if registered:
             return registered
         # Find objects with 2 or more common points
-        reg_common_pts = [obj for obj in cls.elements()
-                          if len(set(obj.points).intersection(set(pts))) > 1]
+        line_counts = collections.Counter()
+        for point in pts:
+            line_counts.update(cls._point_index.get(point, ()))
+        reg_common_pts = [line for line, count in line_counts.items() if count > 1]
         # If objects with 2 or more common points exist, merge them
         obj = None
+        # Point sets of the lines being merged; their segments already exist
+        known_point_sets = [set(registered.points) for registered in reg_common_pts]
         if reg_common_pts:
             for registered in reg_common_pts:
                 pts = cls.bidirectional_order_preserving_merge(registered.points, pts)
@@ -135,19 +179,58 @@ class Line(GeometricObject):
         else:
             obj = super().__new__(cls, key=key)
             obj.points = canonical_points
-        # Create segments for all pairs of points on the line
-        _ = [Segment((obj.points[i], p2))
-             for i in range(len(obj.points))
-             for p2 in obj.points[i+1:]]
+        # Re-index merged lines under the points of the surviving line
+        for registered, known in zip(reg_common_pts, known_point_sets):
+            for point in known:
+                cls._point_index[point].discard(registered)
+        for point in obj.points:
+            cls._point_index[point].add(obj)
+        # Create segments for all pairs of points on the line that were not
+        # already on a common line before the merge
+        for p1, p2 in itertools.combinations(obj.points, 2):
+            if not any(p1 in known and p2 in known for known in known_point_sets):
+                Segment((p1, p2))
         return obj
 
     @property
     def _identifier(self):
         return self.points
 
+    @property
+    def points(self):
+        """Tuple of Points, as ordered on the line
+        """
+        return self._points
+
+    @points.setter
+    def points(self, pts):
+        self.bump_revision()
+        self._points = pts
+        # Position of each point on the line, for O(1) index lookups
+        self._point_index_map = {point: index for index, point in enumerate(pts)}
+        # Nonreflex intersection angles with other lines, keyed by other line
+        self._intersection_angles = {}
+
     def __repr__(self) -> str: # pragma: no cover
         return f'{self.__class__.__name__}({" ".join([p.key for p in self.points])})'
 
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry and point-to-line index
+        """
+        super().reset_registry()
+        cls._point_index = collections.defaultdict(set)
+
+    @classmethod
+    def through(cls, p1: Point, p2: Point):
+        """Registered Line through both p1 and p2, or None if no such line is
+        known. Unlike Line((p1, p2)), nothing is constructed.
+        """
+        for line in cls._point_index.get(p1, ()):
+            if p2 in line._point_index_map:
+                return line
+        return None
+
     @staticmethod
     def canonical_points(pts):
         """Canonical ordering of segment endpoints by lexical ordering"""
@@ -159,23 +242,33 @@ class Line(GeometricObject):
     def bidirectional_order_preserving_merge(s_a, s_b):
         """Merges two sequences of points, if they can be consistently aligned
         """
+        set_a, set_b = set(s_a), set(s_b)
+
         def order_preserving_merge(s_a, s_b):
-            if len(s_a) == 0:
-                return tuple(s_b)
-            if len(s_b) == 0:
-                return tuple(s_a)
-            if s_a[0] == s_b[0]:
-                return (s_a[0],) + tuple(order_preserving_merge(s_a[1:], s_b[1:]))
-            if s_a[0] in s_b:
-                return (s_b[0],) + tuple(order_preserving_merge(s_a, s_b[1:]))
-            if s_b[0] in s_a:
-                return (s_a[0],) + tuple(order_preserving_merge(s_a[1:], s_b))
-            # Neither of the first elements are common among the two tuples
-            raise exceptions.ColinearPointSequenceError(
-                'Order of sequences ambiguous.', s_a, s_b)
-
-        common_ordered_as_s_a = tuple(e for e in s_a if e in s_b)
-        common_ordered_as_s_b = tuple(e for e in s_b if e in s_a)
+            merged = []
+            i, j = 0, 0
+            len_a, len_b = len(s_a), len(s_b)
+            while i < len_a and j < len_b:
+                if s_a[i] == s_b[j]:
+                    merged.append(s_a[i])
+                    i += 1
+                    j += 1
+                elif s_a[i] in set_b:
+                    merged.append(s_b[j])
+                    j += 1
+                elif s_b[j] in set_a:
+                    merged.append(s_a[i])
+                    i += 1
+                else:
+                    # Neither of the current elements are common among the two tuples
+                    raise exceptions.ColinearPointSequenceError(
+                        'Order of sequences ambiguous.', s_a[i:], s_b[j:])
+            merged.extend(s_a[i:])
+            merged.extend(s_b[j:])
+            return tuple(merged)
+
+        common_ordered_as_s_a = tuple(e for e in s_a if e in set_b)
+        common_ordered_as_s_b = tuple(e for e in s_b if e in set_a)
 
         if common_ordered_as_s_a == common_ordered_as_s_b:
             return order_preserving_merge(tuple(s_a), tuple(s_b))
@@ -184,6 +277,12 @@ class Line(GeometricObject):
         raise exceptions.ColinearPointSequenceError(
             'Sequences cannot be aligned consistently.', tuple(s_a), tuple(s_b))
 
+    def segments_on_line(self):
+        """Generates all segments between pairs of points on the line
+        """
+        for p1, p2 in itertools.combinations(self.points, 2):
+            yield Segment((p1, p2))
+
     def segments_with_subsegments(self):
         """All segments contained in the line that have subsegments
         """
@@ -199,9 +298,17 @@ class Line(GeometricObject):
         """
         if not isinstance(other, Line):
             raise ValueError('Intersection point requires a Line as input')
-        common_pts = set(self.points).intersection(set(other.points))
-        if len(common_pts) == 1:
-            return common_pts.pop()
+        if len(self.points) <= len(other.points):
+            shorter, longer = self.points, other._point_index_map
+        else:
+            shorter, longer = other.points, self._point_index_map
+        found = None
+        for point in shorter:
+            if point in longer:
+                if found is not None:
+                    return None
+                found = point
+        return found
 
     def is_interior_of_known_points(self, point: Point):
         """Returns True if point is interior to the line
@@ -216,37 +323,52 @@ class Line(GeometricObject):
             return False
 
     def nonreflex_angles_formed_by_intersection(self, other):
+        # Results are cached until either line's points change or Angles or
+        # Rays are reset. Empty results are not cached, as reflexivity of the
+        # angles may become known later.
+        cached = self._intersection_angles.get(other)
+        if (cached is not None and cached[0] is other.points and
+                cached[1] is Angle._registry and cached[2] is Ray._registry):
+            return list(cached[3])
         intersection = self.intersection_point(other)
         if intersection is None:
             raise RuntimeError("Intersection angles can not be determined due to unknown intersection point.")
-        pts = [self.points[0], other.points[0], self.points[-1], other.points[-1]]
-        rays = [Ray((intersection, point)) if point != intersection else None for point in pts]
-        num_rays = len(rays)
-        angles = []
-        for _ in range(num_rays):
-            ray_pair = (rays[_], rays[(_ + 1) % num_rays])
-            if all(ray_pair):
-                angles.append(Angle(ray_pair))
+        # Rays from the intersection to the endpoints of both lines; each
+        # endpoint's line is known, so Ray need not look it up again
+        ends = ((self.points[0], self), (other.points[0], other),
+                (self.points[-1], self), (other.points[-1], other))
+        rays = tuple(Ray((intersection, point), line=line) if point != intersection else None
+                     for point, line in ends)
+        ray_0, ray_1, ray_2, ray_3 = rays
+        angles = [Angle(ray_pair) for ray_pair in
+                  ((ray_0, ray_1), (ray_1, ray_2), (ray_2, ray_3), (ray_3, ray_0))
+                  if all(ray_pair)]
         reflexivities = [angle.reflex for angle in angles]
         if any([reflex is not None for reflex in reflexivities]):
             if True in reflexivities:
                 angles = [angle.explementary for angle in angles]
             for angle in angles:
                 angle.reflex = False
-            return angles
+            self._intersection_angles[other] = (other.points, Angle._registry,
+                                                Ray._registry, angles)
+            return list(angles)
         else:
             return []
 
     @staticmethod
-    def canonical_ray_direction_point(vertex: Point, pointing_to: Point):
+    def canonical_ray_direction_point(vertex: Point, pointing_to: Point, line=None):
         """Returns a the outrermost known point of a ray defined by a vertex
         and a point on the ray
 
+        The Line through vertex and pointing_to is looked up unless supplied
+        as line.
+
         Raises: ValieError if vertex and pointing_to are the same point
         """
-        line = Line((vertex, pointing_to)) # Will raise ValueError if vertex and pointing_to are the same point
-        v_idx = line.points.index(vertex)
-        p_idx = line.points.index(pointing_to)
+        if line is None:
+            line = Line((vertex, pointing_to)) # Will raise ValueError if vertex and pointing_to are the same point
+        v_idx = line._point_index_map[vertex]
+        p_idx = line._point_index_map[pointing_to]
         if v_idx < p_idx:
             return line.points[-1]
         if v_idx > p_idx:
@@ -256,22 +378,27 @@ class Ray(GeometricObject):
     """A ray represented by a vertex point and another point in the
     direction the ray is pointing to
     """
-    def __new__(cls, pts):
+    def __new__(cls, pts, line=None):
         '''Argument pts is one of the following:
         - a space separated pair of point labels representing a ray, e.g. 'B A'
         - a tuple of two Point objects
+
+        Argument line is the Line through pts, if already known by the caller.
         '''
         pts = points(pts)
         if not (isinstance(pts, tuple) and len(pts) == 2):
             raise ValueError('Instantiating a Ray requires exactly 2 points.')
-        vertex, pointing_to = cls.canonical_points(pts)
-        registered = cls.get(f'{vertex.key} {pointing_to.key}')
+        vertex, pointing_to = cls.canonical_points(pts, line)
+        key = f'{vertex.key} {pointing_to.key}'
+        registered = cls._registry.get(key)
         if registered:
             return registered
         # Create new instance
-        obj = super().__new__(cls, key=f'{vertex.key} {pointing_to.key}')
+        obj = super().__new__(cls, key=key)
         obj.vertex, obj.pointing_to = vertex, pointing_to
-        Line((vertex, pointing_to)).call_when_changed(obj.update_pointing_to)
+        if line is None:
+            line = Line((vertex, pointing_to))
+        line.call_when_changed(obj.update_pointing_to)
         return obj
 
     @property
@@ -279,9 +406,9 @@ class Ray(GeometricObject):
         return (self.vertex, self.pointing_to)
 
     @staticmethod
-    def canonical_points(pts):
+    def canonical_points(pts, line=None):
         vertex, pointing_to = pts
-        pointing_to = Line.canonical_ray_direction_point(vertex, pointing_to)
+        pointing_to = Line.canonical_ray_direction_point(vertex, pointing_to, line)
         return (vertex, pointing_to)
 
     @property
@@ -296,9 +423,11 @@ class Ray(GeometricObject):
     def points_on_line_in_ray_direction(self):
         """Returns all points on the line in the direction of the ray
         """
-        if self.line.points.index(self.vertex) < self.line.points.index(self.pointing_to):
-            return self.line.points
-        return list(reversed(self.line.points))
+        line = self.line
+        index_map = line._point_index_map
+        if index_map[self.vertex] < index_map[self.pointing_to]:
+            return line.points
+        return list(reversed(line.points))
 
     def __repr__(self):
         return f'Ray({self.vertex.key} {self.pointing_to.key})'
@@ -308,27 +437,63 @@ class Segment(GeometricObject):
     """
 
     measure = MeasurableProperty(auto_symbol_prefix = 'mSegment')
+    _pair_key_cache = {}
+    _line = None
+    # Line registry the cached line was resolved from
+    _line_registry = None
 
     def __new__(cls, pts):
         '''Argument pts is one of the following:
         - a space separated pair of point labels representing a segment, e.g. 'B A'
         - a tuple of two Point objects
         '''
+        if type(pts) is str:
+            # Fast path for registered segments given by label: the key
+            # follows from the labels without resolving Points
+            labels = _parse_label(pts)
+            if len(labels) == 2:
+                label_a, label_b = labels
+                key = f'{label_a} {label_b}' if label_a < label_b else f'{label_b} {label_a}'
+                registered = cls._registry.get(key)
+                if registered:
+                    return registered
         pts = points(pts)
         if not (isinstance(pts, tuple) and len(pts) == 2):
             raise ValueError('Instantiating a Segment requires exactly 2 points.')
         # Construct key based on canonically ordered points
-        pts = tuple(sorted(pts))
-        canonical_key = ' '.join([p.key for p in pts])
+        canonical_key = cls.canonical_key(pts)
         # If Segment with canonical_key is already registered, return it
-        registered = cls.get(canonical_key)
+        registered = cls._registry.get(canonical_key)
         if registered:
             return registered
         # Create new instance
         obj = super().__new__(cls, key=canonical_key)
-        obj.points = pts
+        pt_a, pt_b = pts
+        obj.points = (pt_a, pt_b) if pt_a < pt_b else (pt_b, pt_a)
         return obj
 
+    @classmethod
+    def canonical_key(cls, pts):
+        """Registry key for the segment with endpoints pts, memoized on the
+        unordered pair of endpoints
+        """
+        pair = frozenset(pts)
+        key = cls._pair_key_cache.get(pair)
+        if key is None:
+            pt_a, pt_b = pts
+            if pt_b < pt_a:
+                pt_a, pt_b = pt_b, pt_a
+            key = f'{pt_a.key} {pt_b.key}'
+            cls._pair_key_cache[pair] = key
+        return key
+
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry and endpoint key cache
+        """
+        super().reset_registry()
+        cls._pair_key_cache = {}
+
     def solve(self, metric='measure'):
         """Solves for the measure of the segment
         """
@@ -337,31 +502,38 @@ class Segment(GeometricObject):
             # TODO: Find a way to avoid importing outside of top level here
             from euclipy import theorems
             from euclipy.polygon import Triangle
+            # Each theorem batch below is only tried while the measure is unknown
+            if self.measure.is_number: # pylint: disable=no-member
+                return self.measure
             # Try to solve for measure using subsegment sum theorem
             theorems.subsegment_sum_theorem(self.line)
             if self.measure.is_number: # pylint: disable=no-member
                 return self.measure
             # Try to solve for measure using equivalence of area formulas
-            is_altitude_of = [triangle for triangle in Triangle.elements() if self in triangle.altitudes]
+            # An altitude of a triangle starts at one of its vertices
+            is_altitude_of = [triangle for triangle in Triangle.triangles_with_vertices(self.points)
+                              if self in triangle.altitudes]
             for triangle in is_altitude_of:
                 theorems.herons_formula(triangle)
                 theorems.triangle_area_using_altitude(triangle, self)
             if self.measure.is_number: # pylint: disable=no-member
                 return self.measure
             # Try to solve for measure using angle bisector theorem
+            own_points = set(self.points)
             shares_point_with_angle_bisector_of = []
             for triangle in Triangle.elements():
                 for bisector in triangle.angle_bisectors:
-                    if (set(self.points) & set(bisector.points)) and self.line is not bisector.line:
+                    if (own_points & set(bisector.points)) and self.line is not bisector.line:
                         shares_point_with_angle_bisector_of.append(triangle)
+                        break
             for triangle in shares_point_with_angle_bisector_of:
                 for bisector in triangle.angle_bisectors:
                     theorems.angle_bisector_theorem(triangle, bisector)
             if self.measure.is_number: # pylint: disable=no-member
                 return self.measure
             # Try to solve for measure using pythagorean theorem
-            is_edge_of_right_triangle = [triangle for triangle in Triangle.elements() if self in triangle.segments and
-                                         90 in [angle.measure for angle in triangle.angles]]
+            is_edge_of_right_triangle = [triangle for triangle in Triangle.triangles_with_edge(self)
+                                         if triangle.is_right]
             for triangle in is_edge_of_right_triangle:
                 theorems.pythagorean_theorem(triangle)
             if self.measure.is_number: # pylint: disable=no-member
@@ -372,10 +544,14 @@ class Segment(GeometricObject):
 
     def component_of(self):
         from euclipy.polygon import Triangle
-        triangles =  {triangle for triangle in Triangle.elements()
-                      if self in triangle.edges}
-        supersegments = {segment for segment in Segment.elements()
-                         if self in segment.subsegments()}
+        triangles = set(Triangle.triangles_with_edge(self))
+        # Supersegments lie on the same line and extend past both endpoints
+        line_pts = self.line.points
+        idx_l, idx_r = sorted(self.line._point_index_map[pt] for pt in self.points)
+        supersegments = {Segment((line_pts[i], line_pts[j]))
+                         for i in range(idx_l + 1)
+                         for j in range(idx_r, len(line_pts))
+                         if (i, j) != (idx_l, idx_r)}
         return supersegments | triangles
 
     @classmethod
@@ -383,10 +559,8 @@ class Segment(GeometricObject):
         """Returns segment defined by pts if it exists
         Otherwise, returns None
         """
-        pts = tuple(sorted(pts))
-        canonical_key = ' '.join([p.key for p in pts])
-        # If Segment with canonical_key is already registered, return it
-        return cls.get(canonical_key)
+        # If Segment with canonical key is already registered, return it
+        return cls.get(cls.canonical_key(pts))
 
     @property
     def _identifier(self):
@@ -396,32 +570,39 @@ class Segment(GeometricObject):
     def line(self):
         """Returns the Line that segment lies on
         """
-        return Line(self.points)
+        # Resolve the line again if Lines were reset since it was cached
+        if self._line is None or self._line_registry is not Line._registry:
+            self._line = Line(self.points)
+            self._line_registry = Line._registry
+            self._line.call_when_changed(self._follow_line)
+        return self._line
+
+    def _follow_line(self, old_line, new_line):
+        """Follow the cached line when it is replaced. A line that is merely
+        updated still contains the segment, so it stays cached. The callback
+        is carried over to the successor, so it is registered only once.
+        """
+        del old_line
+        if new_line is not None:
+            self._line = new_line
 
     def subsegments(self):
         """Returns a list of all subsegments of the segment, excluding itself
         """
-        line_pts = self.line.points
-        pt_l, pt_r = self.points
-        idx_l, idx_r = line_pts.index(pt_l), line_pts.index(pt_r)
-        if idx_l > idx_r:
-            idx_l, idx_r = idx_r, idx_l
-        seg_pts = line_pts[idx_l:idx_r+1]
-        segments =  [Segment((seg_pts[i], seg_pts[j]))
-                     for i in range(len(seg_pts)-1)
-                     for j in range(i+1, len(seg_pts))]
-        segments.remove(self)
-        return segments
+        seg_pts = self.contained_points()
+        endpoints = (seg_pts[0], seg_pts[-1])
+        return [Segment(pair) for pair in itertools.combinations(seg_pts, 2)
+                if pair != endpoints]
 
     def contained_points(self):
         """Returns a list of all points contained in the segment, including endpoints
         """
-        line_pts = self.line.points
+        line = self.line
         pt_l, pt_r = self.points
-        idx_l, idx_r = line_pts.index(pt_l), line_pts.index(pt_r)
+        idx_l, idx_r = line._point_index_map[pt_l], line._point_index_map[pt_r]
         if idx_l > idx_r:
             idx_l, idx_r = idx_r, idx_l
-        return line_pts[idx_l:idx_r+1]
+        return line.points[idx_l:idx_r+1]
 
     def atomic_subsegments(self):
         """Returns a list of all atomic subsegments of the segment, including itself if atomic
@@ -439,6 +620,7 @@ class Angle(GeometricObject):
     """
 
     measure = MeasurableProperty(auto_symbol_prefix='mAngle', post_set='post_set_measure')
+    _reflex = None
 
     def __new__(cls, pts_or_rays, reflex=None): #TODO: Should reflex default to True?
         '''Argument pts is one of the following:
@@ -458,7 +640,7 @@ class Angle(GeometricObject):
             ray1, ray2 = Ray((pts[1], pts[0])), Ray((pts[1], pts[2]))
         canonical_key = ' '.join([ray1.pointing_to.key, ray1.vertex.key, ray2.pointing_to.key])
         # If Angle with canonical_key is already registered, return it
-        registered = cls.get(canonical_key)
+        registered = cls._registry.get(canonical_key)
         if registered:
             if reflex is not None:
                 registered.reflex = reflex
@@ -473,6 +655,31 @@ class Angle(GeometricObject):
         obj._explementary_paired = False
         return obj
 
+    @classmethod
+    def lookup(cls, pts):
+        """Registered Angle defined by a tuple of three Points, or None if it
+        is not registered. Unlike Angle(pts), nothing is constructed.
+        """
+        pt1, vertex, pt2 = pts
+        line1, line2 = Line.through(vertex, pt1), Line.through(vertex, pt2)
+        if line1 is None or line2 is None:
+            return None
+        pointing_to1 = Line.canonical_ray_direction_point(vertex, pt1, line1)
+        pointing_to2 = Line.canonical_ray_direction_point(vertex, pt2, line2)
+        if pointing_to1 is None or pointing_to2 is None:
+            return None
+        return cls._registry.get(f'{pointing_to1.key} {vertex.key} {pointing_to2.key}')
+
+    @classmethod
+    def measure_of(cls, pts):
+        """Measure of the Angle defined by a tuple of three Points, constructing
+        the Angle only if it is not registered yet
+        """
+        angle = cls.lookup(pts)
+        if angle is None:
+            angle = cls(pts)
+        return angle.measure
+
     def __repr__(self) -> str: # pragma: no cover
         measures = ', '.join([f'{k}={m.value}' for k, m in self.measures.items()])
         reflex = ', reflex=' + repr(self.reflex) if self.reflex is not None else ''
@@ -492,9 +699,7 @@ class Angle(GeometricObject):
 
     @property
     def reflex(self):
-        if hasattr(self, "_reflex"):
-            return self._reflex
-        return None
+        return self._reflex
 
     @reflex.setter
     def reflex(self, reflexivity):
@@ -535,6 +740,8 @@ class Angle(GeometricObject):
             if value <= 0:
                 raise ValueError('Angle must be >  0 degrees.')
         # self.set_explementary_pair()
+        if self._explementary_paired and not value.is_symbol:
+            return
         for obj in [self] + Measure.objects_measured_by(value):
             if not obj._explementary_paired:
                 Expression(obj.measure + obj.explementary.measure - 360)
@@ -1,8 +1,11 @@
 """Classes representing polygons on the Euclidean plane
 """
+import collections
+import functools
+
 import sympy
 
-from euclipy.core import GeometricObject, MeasurableProperty
+from euclipy.core import GeometricObject, MeasurableProperty, revision_cached_property
 from euclipy.geometricobjects import Segment, Angle, Ray, points
 
 class Polygon(GeometricObject):
@@ -10,6 +13,9 @@ class Polygon(GeometricObject):
     """
 
     area = MeasurableProperty(auto_symbol_prefix='Area')
+    # Maps the unordered vertex set of every registered polygon (triangles
+    # included) to that polygon
+    _by_vertex_set = {}
 
     def __new__(cls, pts):
         """Find or construct new Polygon
@@ -31,29 +37,47 @@ class Polygon(GeometricObject):
             return Triangle(pts)
         pts = cls.canonical_points(pts)
         key = ' '.join([pt.key for pt in pts])
-        registered = cls.get(key)
+        registered = cls._registry.get(key)
         if registered:
             return registered
-        existing_with_shared_pts = [obj for obj in cls.elements()
-                                    if set(obj.points) == set(pts)]
+        vertex_set = frozenset(pts)
+        existing_with_shared_pts = Polygon._by_vertex_set.get(vertex_set)
         if existing_with_shared_pts:
-            assert len(existing_with_shared_pts) == 1
             # TODO: Replace with custom error InconsistentConstructionError
             raise RuntimeError(f'Polygon{pts} is inconsistent with {existing_with_shared_pts}.')
         # Create new instance
         obj = super().__new__(cls, key=key)
         obj.points = pts
-        circular_points = obj.points * 2
-        obj.segments = [Segment((p1, p2)) for p1, p2
-                        in zip(pts, circular_points[1:])]
-        obj.angles = [Angle((p1, p2, p3)) for p1, p2, p3 in
-                      zip(pts, circular_points[1:], circular_points[2:])]
+        Polygon._by_vertex_set[vertex_set] = obj
+        num_pts = len(pts)
+        if num_pts == 3:
+            p1, p2, p3 = pts
+            obj.segments = [Segment((p1, p2)), Segment((p2, p3)), Segment((p3, p1))]
+            obj.angles = [Angle((p1, p2, p3)), Angle((p2, p3, p1)), Angle((p3, p1, p2))]
+        else:
+            obj.segments = [Segment((pts[i], pts[(i+1) % num_pts]))
+                            for i in range(num_pts)]
+            obj.angles = [Angle((pts[i], pts[(i+1) % num_pts], pts[(i+2) % num_pts]))
+                          for i in range(num_pts)]
         return obj
 
     def __repr__(self): # pragma: no cover
         return f'{self.__class__.__name__}({" ".join([p.key for p in self.points])})'
 
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry, vertex set index and memoized canonical point
+        orderings
+        """
+        super().reset_registry()
+        # Only drop the polygons of cls; others remain registered
+        Polygon._by_vertex_set = {vertex_set: polygon for vertex_set, polygon
+                                  in Polygon._by_vertex_set.items()
+                                  if not isinstance(polygon, cls)}
+        cls.canonical_points.cache_clear()
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def canonical_points(pts):
         """Provide canonical ordering of points for Polygon
 
@@ -63,22 +87,83 @@ class Polygon(GeometricObject):
         >>> canonical_points((Point('C'), Point('B'), Point('A')))
         (Point(A), Point(C), Point(B))
         """
-        min_point_index = pts.index(min(pts))
+        sort_keys = [pt._sort_key for pt in pts]
+        min_point_index = sort_keys.index(min(sort_keys))
         return pts[min_point_index:] + pts[:min_point_index]
 
 
 class Triangle(Polygon):
     """A triangle represented by its three vertices on the Euclidean plane
     """
+
+    # Map vertices and edges to the triangles having them. Values are dicts
+    # used as insertion-ordered sets, so lookups follow construction order.
+    _vertex_to_triangles = collections.defaultdict(dict)
+    _edge_to_triangles = collections.defaultdict(dict)
+
     def __new__(cls, pts):
-        return super().__new__(cls, pts)
+        pts = points(pts)
+        if len(pts) == 3:
+            # Fast path for registered triangles: rotate the lexically
+            # smallest vertex to the front and look up the key directly
+            p1, p2, p3 = pts
+            k1, k2, k3 = p1._sort_key, p2._sort_key, p3._sort_key
+            if k1 <= k2 and k1 <= k3:
+                key = f'{k1} {k2} {k3}'
+            elif k2 <= k3:
+                key = f'{k2} {k3} {k1}'
+            else:
+                key = f'{k3} {k1} {k2}'
+            registered = cls._registry.get(key)
+            if registered:
+                return registered
+        obj = super().__new__(cls, pts)
+        for vertex, edge in zip(obj.points, obj.segments):
+            cls._vertex_to_triangles[vertex][obj] = None
+            cls._edge_to_triangles[edge][obj] = None
+        return obj
+
+    @classmethod
+    def reset_registry(cls):
+        """Reset registry and vertex/edge indices
+        """
+        super().reset_registry()
+        cls._vertex_to_triangles = collections.defaultdict(dict)
+        cls._edge_to_triangles = collections.defaultdict(dict)
+
+    @classmethod
+    def triangles_with_vertices(cls, vertices):
+        """Registered triangles having any of vertices as a vertex
+        """
+        triangles = {}
+        for vertex in vertices:
+            triangles.update(cls._vertex_to_triangles.get(vertex, {}))
+        return list(triangles)
+
+    @classmethod
+    def triangles_with_edge(cls, edge):
+        """Registered triangles having edge as one of their edges
+        """
+        return list(cls._edge_to_triangles.get(edge, {}))
     
+    @revision_cached_property
+    def angle_measures(self):
+        """The measures of the angles of the triangle
+        """
+        return [angle.measure for angle in self.angles]
+
+    @property
+    def is_right(self):
+        """True if one of the angles of the triangle is known to measure 90
+        """
+        return 90 in self.angle_measures
+
     def edge_opposite_vertex(self, vertex) -> Segment:
         """The edge opposite a vertex of the triangle
         """
-        return Segment(tuple(set(self.points) - set([vertex])))
+        return Segment(tuple(pt for pt in self.points if pt is not vertex))
     
-    @property
+    @revision_cached_property
     def altitudes(self):
         """The altitudes of the triangle
         """
@@ -86,57 +171,51 @@ class Triangle(Polygon):
         for vertex in self.points:
             edge = self.edge_opposite_vertex(vertex)
             for foot in edge.line.points:
-                if foot == edge.points[0]:
-                    angles_to_check = [Angle((vertex, foot, edge.points[1])),
-                                       Angle((edge.points[1], foot, vertex))]
-                elif foot == edge.points[1]:
-                    angles_to_check = [Angle((vertex, foot, edge.points[0])),
-                                       Angle((edge.points[0], foot, vertex))]
-                else:
-                    angles_to_check = [Angle((vertex, foot, edge.points[0])),
-                                    Angle((vertex, foot, edge.points[1])),
-                                    Angle((edge.points[0], foot, vertex)),
-                                    Angle((edge.points[1], foot, vertex))]
-                if any(angle.measure == 90 for angle in angles_to_check):
+                others = [pt for pt in edge.points if pt is not foot]
+                # An unregistered angle has no known measure, so only
+                # registered angles are checked
+                angles_to_check = (Angle.lookup(pts) for other in others
+                                   for pts in ((vertex, foot, other), (other, foot, vertex)))
+                if any(angle is not None and angle.measure == 90
+                       for angle in angles_to_check):
                     altitudes.append(Segment((vertex, foot)))
         return altitudes
     
-    @property
+    @revision_cached_property
     def medians(self):
         """The medians of the triangle
         """
         medians = []
         for vertex in self.points:
             edge = self.edge_opposite_vertex(vertex)
+            p0, p1 = edge.points
             for candidate_endpoint in edge.contained_points()[1:-1]:
-                edge_sub1 = Segment((edge.points[0], candidate_endpoint))
-                edge_sub2 = Segment((edge.points[1], candidate_endpoint))
-                if edge_sub1.measure == edge_sub2.measure:
+                if (Segment((p0, candidate_endpoint)).measure ==
+                        Segment((p1, candidate_endpoint)).measure):
                     medians.append(Segment((vertex, candidate_endpoint)))
         return medians
 
-    @property
+    @revision_cached_property
     def angle_bisectors(self):
         """The angle bisectors of the triangle
         """
         angle_bisectors = []
         for vertex in self.points:
             edge = self.edge_opposite_vertex(vertex)
+            p0, p1 = edge.points
             for candidate_endpoint in edge.contained_points()[1:-1]:
-                angle1 = Angle((candidate_endpoint, vertex, edge.points[0]))
-                angle2 = Angle((edge.points[1], vertex, candidate_endpoint))
-                if angle1.measure == angle2.measure:
+                if (Angle.measure_of((candidate_endpoint, vertex, p0)) ==
+                        Angle.measure_of((p1, vertex, candidate_endpoint))):
                     angle_bisectors.append(Segment((vertex, candidate_endpoint)))
         return angle_bisectors
 
     def sub_and_sur_triangles_from_existing_segments(self):
         new_triangles = set()
         existing_triangles = set(Triangle.elements())
-        for vertex in self.points:
-            circular_points = self.points * 2
-            v_index = circular_points.index(vertex)
+        circular_points = self.points * 2
+        for v_index, vertex in enumerate(self.points):
             other_vertices = circular_points[v_index+1:v_index+3]
-            pts = Ray(tuple(other_vertices)).points_on_line_in_ray_direction()
+            pts = Ray(other_vertices).points_on_line_in_ray_direction()
             pts = [pt for pt in pts if Segment.search_registry((vertex, pt))] #Lines too
             new_triangles |= {Triangle((pts[i], pt2, vertex))
                               for i in range(len(pts)) for pt2 in pts[i+1:]}
@@ -144,14 +223,14 @@ class Triangle(Polygon):
 
     @classmethod
     def all_sub_and_sur_triangles(cls):
-        triangles = list(cls.elements())
-        existing_triangles = triangles[:]
+        existing_triangles = set(cls.elements())
+        triangles = collections.deque(cls.elements())
         while triangles:
             triangle = triangles.pop()
             additions = triangle.sub_and_sur_triangles_from_existing_segments()
             triangles.extend(additions)
-        new_triangles = cls.elements()
-        return list(set(new_triangles) - set(existing_triangles))
+        return [triangle for triangle in cls.elements()
+                if triangle not in existing_triangles]
     
     @classmethod
     def type_one_constructions(cls):
@@ -1,16 +1,27 @@
 """Implementation of theorems
 """
 
+import collections
+
 import sympy
 
 from euclipy.core import Expression
 from euclipy.geometricobjects import Line, Angle, Segment
 from euclipy.polygon import Triangle
 
+_ONE_EIGHTY = sympy.Integer(180)
+_MINUS_ONE_EIGHTY = sympy.Integer(-180)
+_HALF = sympy.Rational(1, 2)
+
+# Heron's formula, expanded once at import: A**2 - s(s - a)(s - b)(s - c) = 0
+_A, _a, _b, _c = sympy.symbols('A a b c')
+_s = (_a + _b + _c) * _HALF
+_HERON = sympy.expand(_A**2 - _s * (_s - _a) * (_s - _b) * (_s - _c))
+
 def definition_supplementary_angles(angles: list):
     """Prototype: Insert equations into registry for supplementary angles
     """
-    Expression(sum(angle.measure for angle in angles) - 180)
+    Expression(sympy.Add(*[angle.measure for angle in angles], _MINUS_ONE_EIGHTY, evaluate=False))
 
 def straight_angle_theorem(line: Line):
     """Prototype: Insert equations into registry for straight angles
@@ -34,13 +45,22 @@ def subsegment_sum_theorem(line: Line):
     # TODO: Refactor once a more concrete theorem framework is in place.
     segs = line.segments_with_subsegments()
     for seg in segs:
-        Expression(seg.measure - sum(_.measure for _ in seg.atomic_subsegments()))
+        Expression(sympy.Add(seg.measure,
+                             *[-_.measure for _ in seg.atomic_subsegments()],
+                             evaluate=False))
         
 def angle_addition_postulate():
     """Prototype: Insert equations into registry for angle addition postulate
     """
-    angles = Angle.elements()
-    angle_pairs = [(angle1, angle2) for angle1 in angles for angle2 in angles if angle1 is not angle2]
+    angles = list(Angle.elements())
+    # Index angles by their first spanning ray, so each angle is only paired
+    # with angles starting where it ends
+    angles_starting_at = collections.defaultdict(list)
+    for angle in angles:
+        angles_starting_at[angle.spanning_rays[0]].append(angle)
+    angle_pairs = [(angle1, angle2) for angle1 in angles
+                   for angle2 in angles_starting_at.get(angle1.spanning_rays[1], ())
+                   if angle1 is not angle2]
     for angle1, angle2 in angle_pairs:
         if (angle1.spanning_rays[1] is angle2.spanning_rays[0] and
             angle1.explementary is not angle2 and
@@ -53,7 +73,8 @@ def triangle_angle_sum_theorem(triangle: Triangle): # TODO: refactor to polygon
     angle_addition_postulate()
     if not isinstance(triangle, Triangle):
         raise ValueError("Triangle angle sum theorem requires a triangle")
-    Expression(180 - sum(angle.measure for angle in triangle.angles))
+    Expression(sympy.Add(_ONE_EIGHTY, *[-angle.measure for angle in triangle.angles],
+                         evaluate=False))
 
 def herons_formula(triangle: Triangle):
     """Prototype: Insert equations into registry for Heron's formula
@@ -61,9 +82,16 @@ def herons_formula(triangle: Triangle):
     if not isinstance(triangle, Triangle):
         raise ValueError("Heron's formula requires a triangle")
     a, b, c = [edge.measure for edge in triangle.segments]
-    s = (a + b + c) / 2
     A = triangle.area
-    expr = (A**2 - s * (s - a) * (s - b) * (s - c)).simplify()
+    if a.is_Number and b.is_Number and c.is_Number:
+        # All edges known: the area is determined, so register it as a linear
+        # equation, which keeps the system solvable without sympy.solve
+        s = (a + b + c) * _HALF
+        area_squared = s * (s - a) * (s - b) * (s - c)
+        if area_squared.is_positive:
+            Expression(A - sympy.sqrt(area_squared))
+            return
+    expr = _HERON.xreplace({_A: A, _a: a, _b: b, _c: c})
     if len(expr.free_symbols & {a, b, c}) <= 1:
         Expression(expr)
 
@@ -78,11 +106,11 @@ def triangle_area_using_altitude(triangle: Triangle, altitude: Segment):
     if altitude not in triangle.altitudes:
         raise ValueError("Triangle area using altitude requires an altitude of the triangle")
     base_points = set(triangle.points) - set(altitude.points)
-    if 90 not in [angle.measure for angle in triangle.angles]:
+    if not triangle.is_right:
         base = Segment(tuple(base_points))
-        Expression(triangle.area - (base.measure * altitude.measure / 2))
+        Expression(triangle.area - (base.measure * altitude.measure * _HALF))
     else:
-        Expression(triangle.area - (triangle.altitudes[0].measure * triangle.altitudes[1].measure)/2)
+        Expression(triangle.area - triangle.altitudes[0].measure * triangle.altitudes[1].measure * _HALF)
     
 
 def angle_bisector_theorem(triangle: Triangle, bisector: Segment):
@@ -92,14 +120,20 @@ def angle_bisector_theorem(triangle: Triangle, bisector: Segment):
         raise ValueError("Angle bisector theorem's bisector requires a Segment")
     if bisector not in triangle.angle_bisectors:
         raise ValueError("Angle bisector theorem requires an angle bisector of the triangle")
-    points_not_in_bisector = list(set(triangle.points) - set(bisector.points))
-    point_on_bisector = list(set(triangle.points) - set(points_not_in_bisector))
-    bisector_point_not_on_triangle = list(set(bisector.points) - set(point_on_bisector))
+    points_not_in_bisector = [pt for pt in triangle.points if pt not in bisector.points]
+    point_on_bisector = [pt for pt in triangle.points if pt in bisector.points]
+    bisector_point_not_on_triangle = [pt for pt in bisector.points if pt not in point_on_bisector]
     Expression(Segment((point_on_bisector[0], points_not_in_bisector[0])).measure / Segment((point_on_bisector[0], points_not_in_bisector[1])).measure -
                Segment((bisector_point_not_on_triangle[0], points_not_in_bisector[0])).measure / Segment((bisector_point_not_on_triangle[0], points_not_in_bisector[1])).measure)
     
 def pythagorean_theorem(triangle: Triangle):
-    if 90 not in [angle.measure for angle in triangle.angles]:
+    if not triangle.is_right:
         raise ValueError("Pythagorean theorem can only be applied to right triangles")
-    triangle_hypotenuse = list(set(triangle.segments) - set(triangle.altitudes))
-    Expression(triangle.altitudes[0].measure ** 2 + triangle.altitudes[1].measure ** 2 - triangle_hypotenuse[0].measure ** 2)
\ No newline at end of file
+    altitudes = triangle.altitudes
+    hypotenuse = next(edge for edge in triangle.segments if edge not in altitudes)
+    leg1, leg2 = altitudes[0].measure, altitudes[1].measure
+    if leg1.is_Number and leg2.is_Number:
+        # Both legs known: register the hypotenuse as a linear equation
+        Expression(hypotenuse.measure - sympy.sqrt(leg1 ** 2 + leg2 ** 2))
+        return
+    Expression(leg1 ** 2 + leg2 ** 2 - hypotenuse.measure ** 2)
\ No newline at end of file
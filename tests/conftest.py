@@ -0,0 +1,11 @@
+"""Shared fixtures for euclipy's tests
+"""
+import pytest
+
+from euclipy.core import RegisteredObject
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Core fixture for all tests ensuring an empty registry at the start
+    """
+    RegisteredObject.reset_registry()
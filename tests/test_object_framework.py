@@ -1,20 +1,18 @@
 """Tests for euclipy's object framework
 """
+import gc
+import weakref
+
 import pytest
+import sympy
 
-from euclipy.core import RegisteredObject, Expression
+from euclipy.core import RegisteredObject, Expression, Measure
 from euclipy.geometricobjects import Point, Segment, Angle, Line, Ray, points
 from euclipy.polygon import Polygon, Triangle
 import euclipy.exceptions as exceptions
 
 # Framework tests
 
-@pytest.fixture(autouse=True)
-def reset_registry():
-    """Core fixture for all tests ensuring an empty registry at the start
-    """
-    RegisteredObject.reset_registry()
-
 def test_reset_registry_acts_recursively():
     """Reseting a registry should reset registries for all subclasses as well
     """
@@ -49,6 +47,24 @@ def test_update_key():
     assert 'B' in RegisteredObject.get_registry()
     assert 'A ' not in RegisteredObject.get_registry()
 
+def test_callbacks_do_not_keep_objects_alive():
+    """Callbacks registered with call_when_changed are weakly referenced and
+    dropped once their owner is garbage collected
+    """
+    class Listener:
+        def __init__(self):
+            self.calls = 0
+        def on_change(self, obj, successor):
+            self.calls += 1
+    obj = RegisteredObject()
+    listener = Listener()
+    obj.call_when_changed(listener.on_change)
+    obj.broadcast_change(None)
+    assert listener.calls == 1
+    del listener
+    obj.broadcast_change(None)
+    assert obj._callbacks == []
+
 def test_elements():
     """Test RegisteredObject.elements() is returning correct iterators
     """
@@ -65,6 +81,13 @@ def test_elements_recursive():
     rec_elems = set(RegisteredObject.elements_recursive())
     assert set([Segment('A B'), Point('A'), Point('B')]) == rec_elems
 
+def test_descendants():
+    """Test RegisteredObject.descendants() lists subclasses at any depth
+    """
+    assert Polygon.descendants() == (Triangle,)
+    assert {Point, Polygon, Triangle} <= set(RegisteredObject.descendants())
+    assert RegisteredObject.classes_recursive() == set(RegisteredObject.descendants())
+
 # Point tests
 
 def test_points_are_cached():
@@ -148,7 +171,7 @@ def test_segments_implicitly_create_points():
     Instantiating Segment('A B') should instantiate Point('A') and Point('B')
     """
     seg = Segment('A B')
-    assert set(_.key for _ in Point.elements()) == {'A', 'B'}
+    assert Point.keys_view() == {'A', 'B'}
     assert set(_.key for _ in seg.points) == {'A', 'B'}
 
 # Polygon tests
@@ -176,11 +199,25 @@ def test_polygons_implicitly_create_segments_and_points():
         Segment('A B'), Segment('B C'), Segment('C D'), Segment('A D')
     """
     poly = Polygon('A B C D')
-    assert set(_.key for _ in Point.elements()) == {'A', 'B', 'C', 'D'}
-    assert set(_.key for _ in Segment.elements()) == {'A B', 'B C', 'C D', 'A D'}
+    assert Point.keys_view() == {'A', 'B', 'C', 'D'}
+    assert Segment.keys_view() == {'A B', 'B C', 'C D', 'A D'}
     assert set(_.key for _ in poly.points) == {'A', 'B', 'C', 'D'}
     assert set(_.key for _ in poly.segments) == {'A B', 'B C', 'C D', 'A D'}
 
+def test_triangles_are_indexed_by_vertex_and_edge():
+    abc = Triangle('A B C')
+    acd = Triangle('A C D')
+    assert Triangle.triangles_with_edge(Segment('A C')) == [abc, acd]
+    assert Triangle.triangles_with_vertices((Point('B'), Point('D'))) == [abc, acd]
+    assert Segment('A B').component_of() == {abc}
+
+def test_triangle_altitudes_update_after_measure_changes():
+    triangle = Triangle('A B C')
+    Line('B D C')
+    assert triangle.altitudes == []
+    Angle('A D B').measure = 90
+    assert triangle.altitudes == [Segment('A D')]
+
 def test_polygon_with_3_vertices_is_triangle():
     """Instantiating a polygon with 3 vertices should return a Triangle
     """
@@ -218,6 +255,12 @@ def test_inconsistent_polygon_raises_exception():
     with pytest.raises(RuntimeError):
         Polygon('E D G F')
 
+def test_triangle_reset_keeps_polygon_consistency_checks():
+    Polygon('A B C D')
+    Triangle.reset_registry()
+    with pytest.raises(RuntimeError):
+        Polygon('A D B C')
+
 # Line tests
 
 def test_lines_are_merged_when_aligned():
@@ -332,6 +375,20 @@ def test_line_segments_with_subsegments():
     L = Line('A B C D')
     assert set(L.segments_with_subsegments()) == {Segment('A C'), Segment('B D'), Segment('A D')}
 
+def test_line_point_index_tracks_merged_lines():
+    Line('A B')
+    Line('C D')
+    line = Line('A B C D')
+    assert all(Line._point_index[Point(label)] == {line} for label in 'ABCD')
+    assert Line('B D') is line
+
+def test_line_merge_creates_segments_between_new_pairs():
+    Line('A B C')
+    line = Line('A C D')
+    assert Segment.search_registry((Point('B'), Point('D'))) is not None
+    assert set(line.segments_on_line()) == {Segment(pair) for pair in
+                                            ('A B', 'A C', 'A D', 'B C', 'B D', 'C D')}
+
 def test_line_intersection_point():
     L1 = Line('A B C')
     with pytest.raises(ValueError):
@@ -375,6 +432,12 @@ def test_atomic_subsegments_of_line():
                                                         Segment('B C'),
                                                         Segment('C D')}
 
+def test_segment_component_of_supersegments():
+    Line('A B C D')
+    assert Segment('B C').component_of() == {Segment('A C'), Segment('B D'),
+                                             Segment('A D')}
+    assert Segment('A D').component_of() == set()
+
 # Ray tests
 
 def test_ray_construction():
@@ -417,6 +480,15 @@ def test_expression_creation():
     assert e1._successor is e2
     assert e1._identifier == e1.expr
 
+def test_equal_expressions_are_deduplicated():
+    """Constructing an expression equal to a registered one after
+    simplification should return the registered Expression"""
+    m1 = Segment('A B').measure
+    m2 = Segment('B C').measure
+    e1 = Expression(m1 + m2 - 5)
+    assert Expression(m2 + m1 - 5) is e1
+    assert len(Expression.elements()) == 1
+
 def test_expression_subs():
     m1 = Segment('A B').measure
     m2 = Segment('B C').measure
@@ -455,6 +527,21 @@ def test_expression_solve():
     assert Segment('B C').measure == 3
     assert Segment('C D').measure == 4
 
+def test_solve_linear_system():
+    m1 = Segment('A B').measure
+    m2 = Segment('B C').measure
+    assert Expression.solve_linear_system([m1 + m2 - 5, m1 - m2 - 1]) == [{m1: 3, m2: 2}]
+    # Underdetermined, singular and nonlinear systems are left to sympy.solve
+    assert Expression.solve_linear_system([m1 + m2 - 5]) is None
+    assert Expression.solve_linear_system([m1 + m2 - 5, 2*m1 + 2*m2 - 10]) is None
+    assert Expression.solve_linear_system([m1 * m2 - 6, m1 - m2 - 1]) is None
+    # Overdetermined systems are solved if consistent
+    assert Expression.solve_linear_system(
+        [m1 + m2 - 5, m1 - m2 - 1, 2*m1 - 6]) == [{m1: 3, m2: 2}]
+    assert Expression.solve_linear_system([m1 + m2 - 5, m1 - m2 - 1, m1 - 4]) == []
+    assert Expression.solve_linear_system(
+        [m1 + m2 - 5, 2*m1 + 2*m2 - 10, 3*m1 + 3*m2 - 15]) is None
+
 def test_expression_solve_with_no_solutions():
     assert Expression.solve_system() == {}
     m1 = Segment('A B').measure
@@ -515,3 +602,87 @@ def test_angle_measure_setter():
     assert Angle('D E F').reflex is False
     with pytest.raises(ValueError):
         Angle('G H I').measure = -1
+
+def test_angle_lookup_does_not_construct():
+    Line('A B C')
+    Line('D B')
+    assert Angle.lookup(points('A B D')) is None
+    assert Angle.get_registry() == {}
+    angle = Angle('A B D')
+    assert Angle.lookup(points('C B D')) is None
+    assert Angle.lookup(points('A B D')) is angle
+    assert Angle.measure_of(points('A B D')) is angle.measure
+
+def test_nonreflex_angles_formed_by_intersection_cache():
+    l1 = Line('A B C')
+    l2 = Line('D B E')
+    Angle('A B D').measure = 70
+    angles = l1.nonreflex_angles_formed_by_intersection(l2)
+    assert l1.nonreflex_angles_formed_by_intersection(l2) == angles
+    Line('A B C F')
+    assert len(l1.nonreflex_angles_formed_by_intersection(l2)) == 4
+    assert Angle('D B F') in l1.nonreflex_angles_formed_by_intersection(l2)
+
+def test_nonreflex_angles_formed_by_intersection_after_angle_reset():
+    l1 = Line('A B C')
+    l2 = Line('D B E')
+    Angle('A B D').measure = 70
+    assert len(l1.nonreflex_angles_formed_by_intersection(l2)) == 4
+    Angle.reset_registry()
+    assert l1.nonreflex_angles_formed_by_intersection(l2) == []
+
+def test_point_bulk_get():
+    a = Point('A')
+    pts = Point.bulk_get(('A', 'B'))
+    assert pts == (a, Point('B'))
+    with pytest.raises(ValueError):
+        Point.bulk_get(('C', ''))
+
+def test_reset_registry_forgets_measures_of_symbols():
+    x = sympy.Symbol('x')
+    Segment('A B').measure = x
+    assert Measure.objects_measured_by(x) == [Segment('A B')]
+    RegisteredObject.reset_registry()
+    assert Measure.objects_measured_by(x) == []
+
+def test_partial_reset_keeps_measures_of_other_classes():
+    m = Segment('A B').measure
+    Triangle.reset_registry()
+    Expression(m - 3)
+    assert Segment('A B').measure == 3
+
+def test_segment_line_callback_registered_once():
+    seg = Segment('A B')
+    line = seg.line
+    for labels in ['A B C', 'A C D', 'A D E', 'B E F']:
+        Line(labels)
+        assert seg.line is line
+    assert len(line._callbacks) == len(set(line._callbacks))
+    follows = [ref for ref in line._callbacks
+               if getattr(ref(), '__self__', None) is seg]
+    assert len(follows) == 1
+    other = Segment('G H')
+    other_line = other.line
+    Line('E F G H')
+    # The line registered first survives; both segments follow it
+    assert other_line._successor is line and seg.line is line
+    assert other.line is line
+    assert 'G' in [pt.key for pt in line.points]
+
+def test_descendants_do_not_keep_classes_alive():
+    class Local(RegisteredObject):
+        pass
+    assert Local in RegisteredObject.descendants()
+    local_ref = weakref.ref(Local)
+    del Local
+    gc.collect()
+    assert local_ref() is None
+    assert all(cls.__name__ != 'Local' for cls in RegisteredObject.descendants())
+
+def test_segment_line_after_line_reset():
+    seg = Segment('A B')
+    seg.line
+    Line.reset_registry()
+    line = Line('A B C')
+    assert seg.line is line
+    assert seg.line in Line.elements()
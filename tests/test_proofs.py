@@ -1,19 +1,11 @@
 """Integration tests for longer proofs
 """
-import pytest
-
 import euclipy.theorems as theorems
-from euclipy.core import Expression, RegisteredObject
+from euclipy.core import Expression
 from euclipy.geometricobjects import Line, Segment, Angle
 from euclipy.polygon import Triangle
 import sympy
 
-@pytest.fixture(autouse=True)
-def reset_registry():
-    """Core fixture for all tests ensuring an empty registry at the start
-    """
-    RegisteredObject.reset_registry()
-
 def test_subsegment_sum_theorem():
     """Verify theorems.theorem_subsegment_sum is working correctly
     """
@@ -49,6 +41,22 @@ def test_straight_angle_theorem():
     theorems.straight_angle_theorem(Line('F G H'))
     assert Angle('H G L').measure == 90
 
+def test_herons_formula():
+    triangle = Triangle('A B C')
+    Segment('A B').measure = 3
+    Segment('B C').measure = 4
+    Segment('C A').measure = 5
+    theorems.herons_formula(triangle)
+    assert triangle.area == 6
+
+def test_pythagorean_theorem():
+    triangle = Triangle('A B C')
+    Angle('A B C').measure = 90
+    Segment('A B').measure = 5
+    Segment('B C').measure = 12
+    theorems.pythagorean_theorem(triangle)
+    assert Segment('A C').measure == 13
+
 def test_2016_amc12b_problem_17():
     Triangle('A C B')
 